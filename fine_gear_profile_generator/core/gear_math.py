@@ -1,66 +1,136 @@
+import math
 import numpy as np
 
 def inv(alpha_rad):
     """Calculates the involute function (tan(a) - a)"""
     return np.tan(alpha_rad) - alpha_rad
 
+def _as_float_arrays(*values):
+    """Converts the arguments to float arrays broadcast to a common shape."""
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+
 def calculate_operating_pressure_angle(z1, z2, x1, x2, alpha_deg):
     """Calculates the operating pressure angle."""
-    alpha_rad = np.deg2rad(alpha_deg)
-    inv_alpha_w = inv(alpha_rad) + 2 * (x1 + x2) * np.tan(alpha_rad) / (z1 + z2)
+    alpha_rad = math.radians(alpha_deg)
+    tan_alpha = math.tan(alpha_rad)
+    inv_alpha_w = tan_alpha - alpha_rad + 2 * (x1 + x2) * tan_alpha / (z1 + z2)
     # Using a simple iterative solver to find the angle from its involute
     alpha_w = alpha_rad  # Start with the standard pressure angle as an initial guess
     for _ in range(10): # 10 iterations are usually more than enough
-        f = inv(alpha_w) - inv_alpha_w
-        f_prime = np.tan(alpha_w)**2
+        t = math.tan(alpha_w)
+        f = t - alpha_w - inv_alpha_w  # inv(alpha_w) - inv_alpha_w, reusing tan(alpha_w)
+        if abs(f) < 1e-14:  # Converged, usually within 3-4 iterations
+            break
+        f_prime = t * t
         if abs(f_prime) < 1e-9:  # Avoid division by zero
             break
         alpha_w = alpha_w - f / f_prime
     return alpha_w
 
+def calculate_operating_pressure_angle_batch(z1, z2, x1, x2, alpha_deg):
+    """
+    Array version of calculate_operating_pressure_angle for parameter sweeps.
+    All gear pairs are solved together; each element stops updating once converged.
+    """
+    z1, z2, x1, x2, alpha_deg = _as_float_arrays(z1, z2, x1, x2, alpha_deg)
+    alpha_rad = np.deg2rad(alpha_deg)
+    tan_alpha = np.tan(alpha_rad)
+    inv_alpha_w = tan_alpha - alpha_rad + 2 * (x1 + x2) * tan_alpha / (z1 + z2)
+    alpha_w = alpha_rad.copy()
+    active = np.ones(alpha_w.shape, dtype=bool)
+    for _ in range(10):
+        t = np.tan(alpha_w)
+        f = t - alpha_w - inv_alpha_w
+        f_prime = t * t
+        active &= (np.abs(f) >= 1e-14) & (np.abs(f_prime) >= 1e-9)
+        if not active.any():
+            break
+        alpha_w -= np.divide(f, f_prime, out=np.zeros_like(f), where=active)
+    return alpha_w
+
 def calculate_contact_ratio(m, z1, z2, x1, x2, alpha_deg, a1=1.0):
     """Calculates the contact ratio for a pair of spur gears."""
-    alpha_rad = np.deg2rad(alpha_deg)
+    alpha_rad = math.radians(alpha_deg)
+    cos_alpha = math.cos(alpha_rad)
     alpha_w_rad = calculate_operating_pressure_angle(z1, z2, x1, x2, alpha_deg)
 
     # Center distance modification due to profile shift
-    c = m * (z1 + z2) / 2 * (np.cos(alpha_rad) / np.cos(alpha_w_rad))
+    c = m * (z1 + z2) / 2 * (cos_alpha / math.cos(alpha_w_rad))
 
     # Base circle radii
-    rb1 = m * z1 * np.cos(alpha_rad) / 2
-    rb2 = m * z2 * np.cos(alpha_rad) / 2
+    rb1 = m * z1 * cos_alpha / 2
+    rb2 = m * z2 * cos_alpha / 2
 
     # Addendum circle radii
     ra1 = m * (z1 / 2 + a1 + x1)
     ra2 = m * (z2 / 2 + a1 + x2)
 
     # Check for valid square root arguments
-    val1 = ra1**2 - rb1**2
-    val2 = ra2**2 - rb2**2
+    val1 = ra1 * ra1 - rb1 * rb1
+    val2 = ra2 * ra2 - rb2 * rb2
     if val1 < 0 or val2 < 0:
         return 0, c # Cannot calculate contact ratio if addendum is below base circle
 
     # Length of the path of contact
-    g_alpha = (np.sqrt(val1) + np.sqrt(val2)) - c * np.sin(alpha_w_rad)
+    g_alpha = (math.sqrt(val1) + math.sqrt(val2)) - c * math.sin(alpha_w_rad)
 
     # Base pitch
-    pb = m * np.pi * np.cos(alpha_rad)
+    pb = m * math.pi * cos_alpha
 
     # Contact ratio
     epsilon_alpha = g_alpha / pb
     return epsilon_alpha, c
 
+def calculate_contact_ratio_batch(m, z1, z2, x1, x2, alpha_deg, a1=1.0):
+    """
+    Array version of calculate_contact_ratio for parameter sweeps.
+    Returns (epsilon_alpha, center_distance) arrays; as in the scalar version the
+    contact ratio is 0 where an addendum circle lies inside its base circle.
+    """
+    m, z1, z2, x1, x2, alpha_deg, a1 = _as_float_arrays(m, z1, z2, x1, x2, alpha_deg, a1)
+    alpha_rad = np.deg2rad(alpha_deg)
+    cos_alpha = np.cos(alpha_rad)
+    alpha_w_rad = calculate_operating_pressure_angle_batch(z1, z2, x1, x2, alpha_deg)
+
+    c = m * (z1 + z2) / 2 * (cos_alpha / np.cos(alpha_w_rad))
+
+    rb1 = m * z1 * cos_alpha / 2
+    rb2 = m * z2 * cos_alpha / 2
+    ra1 = m * (z1 / 2 + a1 + x1)
+    ra2 = m * (z2 / 2 + a1 + x2)
+
+    val1 = ra1 * ra1 - rb1 * rb1
+    val2 = ra2 * ra2 - rb2 * rb2
+    valid = (val1 >= 0) & (val2 >= 0)
+
+    g_alpha = np.sqrt(np.where(valid, val1, 0)) + np.sqrt(np.where(valid, val2, 0)) - c * np.sin(alpha_w_rad)
+    pb = m * np.pi * cos_alpha
+    epsilon_alpha = np.where(valid, g_alpha / pb, 0.0)
+    return epsilon_alpha, c
+
 def check_undercut(Z, ALPHA, X, A):
     """Checks for undercut on a single gear."""
     if Z <= 0:
         return "Not applicable for internal gears in this context"
-    alpha_rad = np.deg2rad(ALPHA)
+    alpha_rad = math.radians(ALPHA)
     # Minimum profile shift coefficient to avoid undercut
-    x_min = A - (Z / 2.0) * (np.sin(alpha_rad)**2)
+    sin_alpha = math.sin(alpha_rad)
+    x_min = A - (Z / 2.0) * (sin_alpha * sin_alpha)
     if X < x_min:
         return f"Warning: Risk of undercut (x < {x_min:.3f})"
     return "OK"
 
+def check_undercut_batch(Z, ALPHA, X, A):
+    """
+    Array version of check_undercut for parameter sweeps.
+    Returns a boolean array that is True where a gear risks undercut; internal
+    gears (Z <= 0) are never flagged, matching the scalar "not applicable" case.
+    """
+    Z, ALPHA, X, A = _as_float_arrays(Z, ALPHA, X, A)
+    sin_alpha = np.sin(np.deg2rad(ALPHA))
+    x_min = A - (Z / 2.0) * (sin_alpha * sin_alpha)
+    return (Z > 0) & (X < x_min)
+
 def handle_internal_gear_parameters(Z, X, B, A, D, C, E):
     """Normalizes parameters for internal gears by inverting them."""
     if Z < 0:
@@ -70,33 +140,49 @@ def handle_internal_gear_parameters(Z, X, B, A, D, C, E):
         C, E = E, C
     return Z, X, B, A, D, C, E
 
+def handle_internal_gear_parameters_batch(Z, X, B, A, D, C, E):
+    """
+    Array version of handle_internal_gear_parameters for parameter sweeps.
+    Every argument is broadcast to a common shape; entries with Z < 0 are normalized
+    without a per-gear branch by flipping signs and selecting the swapped factors.
+    """
+    Z, X, B, A, D, C, E = _as_float_arrays(Z, X, B, A, D, C, E)
+    internal = Z < 0
+    sign = np.where(internal, -1.0, 1.0)
+    return (Z * sign, X * sign, B * sign,
+            np.where(internal, D, A), np.where(internal, A, D),
+            np.where(internal, E, C), np.where(internal, C, E))
+
 def calculate_gear_parameters(M, Z, ALPHA, X, B, A, D, C, E):
     """
     Calculates various geometric parameters and angles for tooth profile generation.
     This function is complex and seems highly specific to the generating process.
     """
-    ALPHA_0 = np.deg2rad(ALPHA)
-    ALPHA_M = np.pi / Z
-    ALPHA_IS = ALPHA_0 + np.pi / (2 * Z) + B / (Z * np.cos(ALPHA_0)) - (1 + 2 * X / Z) * np.sin(ALPHA_0) / np.cos(ALPHA_0)
-    THETA_IS = np.tan(ALPHA_0) + 2 * (C * (1 - np.sin(ALPHA_0)) + X - D) / (Z * np.cos(ALPHA_0) * np.sin(ALPHA_0))
-
-    sqrt_val_ie = ((Z + 2 * (X + A - E)) / (Z * np.cos(ALPHA_0)))**2 - 1
+    ALPHA_0 = math.radians(ALPHA)
+    # Trig terms of the standard pressure angle are shared by most expressions below
+    SIN_0 = math.sin(ALPHA_0)
+    COS_0 = math.cos(ALPHA_0)
+    ALPHA_M = math.pi / Z
+    ALPHA_IS = ALPHA_0 + math.pi / (2 * Z) + B / (Z * COS_0) - (1 + 2 * X / Z) * SIN_0 / COS_0
+    THETA_IS = math.tan(ALPHA_0) + 2 * (C * (1 - SIN_0) + X - D) / (Z * COS_0 * SIN_0)
+
+    # The same root term appears in both the involute end parameter and the tip angle
+    ratio_ie = (Z + 2 * (X + A - E)) / (Z * COS_0)
+    sqrt_val_ie = ratio_ie * ratio_ie - 1
     if sqrt_val_ie < 0:
         sqrt_val_ie = 0
-    THETA_IE = 2 * E / (Z * np.cos(ALPHA_0)) + np.sqrt(sqrt_val_ie)
-
-    sqrt_val_ae = ((Z + 2 * (X + A - E)) / (Z * np.cos(ALPHA_0)))**2 - 1
-    if sqrt_val_ae < 0:
-        sqrt_val_ae = 0
-    ALPHA_E = ALPHA_IS + THETA_IE - np.arctan(np.sqrt(sqrt_val_ae))
+    sqrt_ie = math.sqrt(sqrt_val_ie)
+    THETA_IE = 2 * E / (Z * COS_0) + sqrt_ie
+    ALPHA_E = ALPHA_IS + THETA_IE - math.atan(sqrt_ie)
 
-    if (ALPHA_E > ALPHA_M) and (ALPHA_M > ALPHA_IS + THETA_IE - np.arctan(THETA_IE)):
-        sqrt_val_e = (1 / np.cos(ALPHA_IS + THETA_IE - ALPHA_M))**2 - 1
+    if (ALPHA_E > ALPHA_M) and (ALPHA_M > ALPHA_IS + THETA_IE - math.atan(THETA_IE)):
+        sec_e = 1 / math.cos(ALPHA_IS + THETA_IE - ALPHA_M)
+        sqrt_val_e = sec_e * sec_e - 1
         if sqrt_val_e < 0:
             sqrt_val_e = 0
-        E = (E / 2) * np.cos(ALPHA_0) * (THETA_IE - np.sqrt(sqrt_val_e))
+        E = (E / 2) * COS_0 * (THETA_IE - math.sqrt(sqrt_val_e))
 
-    P_ANGLE = 2 * np.pi / Z
-    ALIGN_ANGLE = np.pi / 2 - np.pi / Z
+    P_ANGLE = 2 * math.pi / Z
+    ALIGN_ANGLE = math.pi / 2 - math.pi / Z
 
     return ALPHA_0, ALPHA_M, ALPHA_IS, THETA_IS, THETA_IE, ALPHA_E, E, P_ANGLE, ALIGN_ANGLE
\ No newline at end of file
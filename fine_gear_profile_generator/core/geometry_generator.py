@@ -1,61 +1,130 @@
+import functools
+import math
+import operator
 import numpy as np
 from . import gear_math
-from . import transformations
 
-def involute_curve(M, Z, SEG_INVOLUTE, THETA_IS, THETA_IE, ALPHA_0, ALPHA_IS):
+@functools.lru_cache(maxsize=32)
+def _ramp(num, dtype=np.float64):
+    """Returns a read-only 0..num-1 ramp of the given dtype, cached per segment count."""
+    if num < 0:
+        raise ValueError(f"Number of samples, {num}, must be non-negative.")
+    ramp = np.arange(num, dtype=dtype)
+    ramp.flags.writeable = False
+    return ramp
+
+def _linspace(start, stop, num, dtype=np.float64):
+    """
+    Equivalent of np.linspace(start, stop, num) built from a cached integer ramp,
+    avoiding np.linspace's per-call setup when the same segment counts are reused.
+    """
+    step = (stop - start) / (num - 1) if num > 1 else 0.0
+    values = _ramp(num, dtype) * step
+    values += start
+    if num > 1:
+        values[-1] = stop
+    return values
+
+def _arc(R, THETA_START, THETA_END, SEGMENTS, X_C=0.0, Y_C=0.0, dtype=np.float64):
+    """
+    Generates SEGMENTS points on a circular arc of radius R around (X_C, Y_C).
+    cos/sin are scaled and offset in place; the angle buffer is reused for the sine.
+    """
+    THETA = _linspace(THETA_START, THETA_END, SEGMENTS, dtype)
+    XX = np.cos(THETA)
+    XX *= R
+    YY = np.sin(THETA, out=THETA)
+    YY *= R
+    if X_C != 0 or Y_C != 0:
+        XX += X_C
+        YY += Y_C
+    return XX, YY
+
+def involute_curve(M, Z, SEG_INVOLUTE, THETA_IS, THETA_IE, ALPHA_0, ALPHA_IS, dtype=np.float64):
     """Generates the involute part of the tooth flank."""
-    THETA1 = np.linspace(THETA_IS, THETA_IE, SEG_INVOLUTE)
-    X11 = (1/2) * M * Z * np.cos(ALPHA_0) * np.sqrt(1 + THETA1**2) * np.cos(ALPHA_IS + THETA1 - np.arctan(THETA1))
-    Y11 = (1/2) * M * Z * np.cos(ALPHA_0) * np.sqrt(1 + THETA1**2) * np.sin(ALPHA_IS + THETA1 - np.arctan(THETA1))
+    THETA1 = _linspace(THETA_IS, THETA_IE, SEG_INVOLUTE, dtype)
+    # Radius and polar angle are shared by both coordinates, so evaluate them once
+    # R1 = r_b * sqrt(1 + THETA1^2), built in a single buffer
+    R1 = np.square(THETA1)
+    R1 += 1
+    np.sqrt(R1, out=R1)
+    R1 *= (1/2) * M * Z * math.cos(ALPHA_0)
+    PHI1 = ALPHA_IS + THETA1 - np.arctan(THETA1)
+    # cos and sin of PHI1 are scaled in place; PHI1 itself is reused for the sine
+    X11 = np.cos(PHI1)
+    X11 *= R1
+    Y11 = np.sin(PHI1, out=PHI1)
+    Y11 *= R1
     return X11, Y11
 
-def edge_round_curve(M, E, X11, Y11, X_E, Y_E, X_E0, Y_E0, SEG_EDGE_R):
+def edge_round_curve(M, E, X11, Y11, X_E, Y_E, X_E0, Y_E0, SEG_EDGE_R, dtype=np.float64):
     """Generates the rounded edge curve at the tooth tip."""
-    THETA3_MIN = np.arctan2((Y11[-1] - Y_E0), (X11[-1] - X_E0))
-    THETA3_MAX = np.arctan2((Y_E - Y_E0), (X_E - X_E0))
-    THETA3 = np.linspace(THETA3_MIN, THETA3_MAX, SEG_EDGE_R)
-    X21 = M * E * np.cos(THETA3) + X_E0
-    Y21 = M * E * np.sin(THETA3) + Y_E0
-    return X21, Y21
-
-def root_round_curve(M, Z, X, D, C, B, THETA_TE, ALPHA_TS, SEG_ROOT_R):
+    THETA3_MIN = math.atan2((Y11[-1] - Y_E0), (X11[-1] - X_E0))
+    THETA3_MAX = math.atan2((Y_E - Y_E0), (X_E - X_E0))
+    return _arc(M * E, THETA3_MIN, THETA3_MAX, SEG_EDGE_R, X_E0, Y_E0, dtype)
+
+def root_round_curve(M, Z, X, D, C, B, THETA_TE, ALPHA_TS, SEG_ROOT_R, dtype=np.float64):
     """Generates the trochoidal root fillet curve."""
-    THETA_T = np.linspace(0, THETA_TE, SEG_ROOT_R)
+    THETA_T = _linspace(0, THETA_TE, SEG_ROOT_R, dtype)
     denominator = M * D - M * X - M * C
     if (C != 0) and (denominator == 0):
-        THETA_S = (np.pi / 2) * np.ones(len(THETA_T))
+        THETA_S = np.full(len(THETA_T), math.pi / 2, dtype=dtype)
     elif denominator != 0:
         THETA_S = np.arctan((M * Z * THETA_T / 2) / denominator)
     else:
-        THETA_S = np.zeros(len(THETA_T))
-    X31 = M * ((Z / 2 + X - D + C) * np.cos(THETA_T + ALPHA_TS) + (Z / 2) * THETA_T * np.sin(THETA_T + ALPHA_TS) - C * np.cos(THETA_S + THETA_T + ALPHA_TS))
-    Y31 = M * ((Z / 2 + X - D + C) * np.sin(THETA_T + ALPHA_TS) - (Z / 2) * THETA_T * np.cos(THETA_T + ALPHA_TS) - C * np.sin(THETA_S + THETA_T + ALPHA_TS))
+        THETA_S = np.zeros(len(THETA_T), dtype=dtype)
+    # Angles shared by the X and Y expressions are evaluated once
+    PHI_T = THETA_T + ALPHA_TS
+    PHI_S = THETA_S + PHI_T
+    COS_T, SIN_T = np.cos(PHI_T), np.sin(PHI_T)
+    R_T = Z / 2 + X - D + C
+    ROLL = (Z / 2) * THETA_T
+    X31 = M * (R_T * COS_T + ROLL * SIN_T - C * np.cos(PHI_S))
+    Y31 = M * (R_T * SIN_T - ROLL * COS_T - C * np.sin(PHI_S))
     return X31, Y31
 
-def outer_arc(M, Z, X, A, ALPHA_E, ALPHA_M, SEG_OUTER):
+def outer_arc(M, Z, X, A, ALPHA_E, ALPHA_M, SEG_OUTER, dtype=np.float64):
     """Generates the outer arc at the tooth tip (addendum circle)."""
-    THETA6 = np.linspace(ALPHA_E, ALPHA_M, SEG_OUTER)
-    X41 = M * (Z / 2 + A + X) * np.cos(THETA6)
-    Y41 = M * (Z / 2 + A + X) * np.sin(THETA6)
-    return X41, Y41
+    return _arc(M * (Z / 2 + A + X), ALPHA_E, ALPHA_M, SEG_OUTER, dtype=dtype)
 
-def root_arc(M, Z, X, D, ALPHA_TS, SEG_ROOT):
+def root_arc(M, Z, X, D, ALPHA_TS, SEG_ROOT, dtype=np.float64):
     """Generates the root arc at the bottom of the tooth space (dedendum circle)."""
-    THETA7 = np.linspace(0, ALPHA_TS, SEG_ROOT)
-    X51 = M * (Z / 2 - D + X) * np.cos(THETA7)
-    Y51 = M * (Z / 2 - D + X) * np.sin(THETA7)
-    return X51, Y51
-
-def combine_tooth_profile(X11, Y11, X21, Y21, X31, Y31, X41, Y41, X51, Y51, X12, Y12, X22, Y22, X32, Y32, X42, Y42, X52, Y52):
-    """Combines all curve segments into a single, continuous tooth profile."""
-    X1 = np.concatenate((X42[1:], X22[1:], X12[1:], X32[1:], X52[1:], X51, X31[1:], X11[1:], X21[1:], X41[1:]))
-    Y1 = np.concatenate((Y42[1:], Y22[1:], Y12[1:], Y32[1:], Y52[1:], Y51, Y31[1:], Y11[1:], Y21[1:], Y41[1:]))
+    return _arc(M * (Z / 2 - D + X), 0, ALPHA_TS, SEG_ROOT, dtype=dtype)
+
+def combine_tooth_profile(X11, Y11, X21, Y21, X31, Y31, X41, Y41, X51, Y51, dtype=np.float64):
+    """
+    Combines all curve segments into a single, continuous tooth profile.
+    Only one flank is passed in; the symmetrical flank is written directly into
+    the output as its mirror image (as produced by transformations.reflect_y).
+    """
+    # Every segment except the first root arc drops its first point, which duplicates
+    # the last point of the preceding segment. Mirrored segments are also reversed,
+    # so [::-1][1:] becomes [-2::-1] and their Y values are negated.
+    MIRRORED, TAIL, FULL = slice(-2, None, -1), slice(1, None), slice(None)
+    segments = (
+        (X41, Y41, MIRRORED), (X21, Y21, MIRRORED), (X11, Y11, MIRRORED), (X31, Y31, MIRRORED), (X51, Y51, MIRRORED),
+        (X51, Y51, FULL), (X31, Y31, TAIL), (X11, Y11, TAIL), (X21, Y21, TAIL), (X41, Y41, TAIL),
+    )
+    n_total = sum(len(XS[part]) for XS, _, part in segments)
+    # X and Y are rows of one contiguous (2, n_total) buffer rather than two allocations
+    X1, Y1 = np.empty((2, n_total), dtype=dtype)
+    start = 0
+    for XS, YS, part in segments:
+        end = start + len(XS[part])
+        X1[start:end] = XS[part]
+        if part is MIRRORED:
+            np.negative(YS[part], out=Y1[start:end])
+        else:
+            Y1[start:end] = YS[part]
+        start = end
     return X1, Y1
 
-def generate_tooth_profile(M, Z, ALPHA, X, B, A, D, C, E, SEG_INVOLUTE, SEG_EDGE_R, SEG_ROOT_R, SEG_OUTER, SEG_ROOT):
+def generate_tooth_profile(M, Z, ALPHA, X, B, A, D, C, E, SEG_INVOLUTE, SEG_EDGE_R, SEG_ROOT_R, SEG_OUTER, SEG_ROOT, dtype=np.float64):
     """
     Main function to generate a single gear tooth profile by calling all necessary
     calculation and geometry generation sub-functions.
+    The coordinate arrays use the given dtype; np.float32 halves their size for
+    plotting and preview output, while float64 remains the default for CAD export.
     """
     Z_calc, X_calc, B_calc, A_calc, D_calc, C_calc, E_calc = gear_math.handle_internal_gear_parameters(Z, X, B, A, D, C, E)
 
@@ -64,37 +133,47 @@ def generate_tooth_profile(M, Z, ALPHA, X, B, A, D, C, E, SEG_INVOLUTE, SEG_EDGE
     )
 
     # Generate one flank of the tooth
-    X11, Y11 = involute_curve(M, Z_calc, SEG_INVOLUTE, THETA_IS, THETA_IE, ALPHA_0, ALPHA_IS)
-
-    # Generate the symmetrical other flank
-    X12, Y12 = transformations.reflect_y(X11, Y11)
+    X11, Y11 = involute_curve(M, Z_calc, SEG_INVOLUTE, THETA_IS, THETA_IE, ALPHA_0, ALPHA_IS, dtype)
 
     # Calculate points for edge rounding
-    X_E = M * ((Z_calc / 2) + X_calc + A_calc) * np.cos(ALPHA_E)
-    Y_E = M * ((Z_calc / 2) + X_calc + A_calc) * np.sin(ALPHA_E)
-    X_E0 = M * (Z_calc / 2 + X_calc + A_calc - E_calc) * np.cos(ALPHA_E)
-    Y_E0 = M * (Z_calc / 2 + X_calc + A_calc - E_calc) * np.sin(ALPHA_E)
+    COS_E = math.cos(ALPHA_E)
+    SIN_E = math.sin(ALPHA_E)
+    X_E = M * ((Z_calc / 2) + X_calc + A_calc) * COS_E
+    Y_E = M * ((Z_calc / 2) + X_calc + A_calc) * SIN_E
+    X_E0 = M * (Z_calc / 2 + X_calc + A_calc - E_calc) * COS_E
+    Y_E0 = M * (Z_calc / 2 + X_calc + A_calc - E_calc) * SIN_E
 
     # Generate curve segments
-    X21, Y21 = edge_round_curve(M, E_calc, X11, Y11, X_E, Y_E, X_E0, Y_E0, SEG_EDGE_R)
-    X22, Y22 = transformations.reflect_y(X21, Y21)
+    X21, Y21 = edge_round_curve(M, E_calc, X11, Y11, X_E, Y_E, X_E0, Y_E0, SEG_EDGE_R, dtype)
 
-    ALPHA_TS = (2 * (C_calc * (1 - np.sin(ALPHA_0)) - D_calc) * np.sin(ALPHA_0) + B_calc) / (Z_calc * np.cos(ALPHA_0)) - 2 * C_calc * np.cos(ALPHA_0) / Z_calc + np.pi / (2 * Z_calc)
-    THETA_TE = 2 * C_calc * np.cos(ALPHA_0) / Z_calc - 2 * (D_calc - X_calc - C_calc * (1 - np.sin(ALPHA_0))) * np.cos(ALPHA_0) / (Z_calc * np.sin(ALPHA_0))
+    SIN_0 = math.sin(ALPHA_0)
+    COS_0 = math.cos(ALPHA_0)
+    ALPHA_TS = (2 * (C_calc * (1 - SIN_0) - D_calc) * SIN_0 + B_calc) / (Z_calc * COS_0) - 2 * C_calc * COS_0 / Z_calc + math.pi / (2 * Z_calc)
+    THETA_TE = 2 * C_calc * COS_0 / Z_calc - 2 * (D_calc - X_calc - C_calc * (1 - SIN_0)) * COS_0 / (Z_calc * SIN_0)
 
-    X31, Y31 = root_round_curve(M, Z_calc, X_calc, D_calc, C_calc, B_calc, THETA_TE, ALPHA_TS, SEG_ROOT_R)
-    X32, Y32 = transformations.reflect_y(X31, Y31)
+    X31, Y31 = root_round_curve(M, Z_calc, X_calc, D_calc, C_calc, B_calc, THETA_TE, ALPHA_TS, SEG_ROOT_R, dtype)
 
-    X41, Y41 = outer_arc(M, Z_calc, X_calc, A_calc, ALPHA_E, ALPHA_M, SEG_OUTER)
-    X42, Y42 = transformations.reflect_y(X41, Y41)
+    X41, Y41 = outer_arc(M, Z_calc, X_calc, A_calc, ALPHA_E, ALPHA_M, SEG_OUTER, dtype)
 
-    X51, Y51 = root_arc(M, Z_calc, X_calc, D_calc, ALPHA_TS, SEG_ROOT)
-    X52, Y52 = transformations.reflect_y(X51, Y51)
+    X51, Y51 = root_arc(M, Z_calc, X_calc, D_calc, ALPHA_TS, SEG_ROOT, dtype)
 
-    # Combine all segments into a single tooth profile
-    X_tooth, Y_tooth = combine_tooth_profile(
-        X11, Y11, X21, Y21, X31, Y31, X41, Y41, X51, Y51,
-        X12, Y12, X22, Y22, X32, Y32, X42, Y42, X52, Y52
-    )
+    # Combine all segments and the mirrored flank into a single tooth profile
+    X_tooth, Y_tooth = combine_tooth_profile(X11, Y11, X21, Y21, X31, Y31, X41, Y41, X51, Y51, dtype)
+
+    return X_tooth, Y_tooth, Z_calc, P_ANGLE, ALIGN_ANGLE
+
+_get_gear_pair_values = operator.itemgetter('M', 'ALPHA', 'B', 'A', 'D', 'C', 'E', 'Z', 'X', 'z2', 'x2')
+_get_segment_values = operator.itemgetter('SEG_INVOLUTE', 'SEG_EDGE_R', 'SEG_ROOT_R', 'SEG_OUTER', 'SEG_ROOT')
+
+def generate_gear_pair(params, dtype=np.float64):
+    """
+    Generates the tooth profiles of a meshing gear pair from a parameter dictionary.
+    Gear 1 uses 'Z' and 'X', gear 2 uses 'z2' and 'x2'; all other factors and the
+    segmentation settings are shared by both gears.
+    """
+    M, ALPHA, B, A, D, C, E, Z1, X1, Z2, X2 = _get_gear_pair_values(params)
+    SEGMENTS = _get_segment_values(params)
 
-    return X_tooth, Y_tooth, Z_calc, P_ANGLE, ALIGN_ANGLE
\ No newline at end of file
+    gear1_profile = generate_tooth_profile(M, Z1, ALPHA, X1, B, A, D, C, E, *SEGMENTS, dtype=dtype)
+    gear2_profile = generate_tooth_profile(M, Z2, ALPHA, X2, B, A, D, C, E, *SEGMENTS, dtype=dtype)
+    return gear1_profile, gear2_profile
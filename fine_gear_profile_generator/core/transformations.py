@@ -1,3 +1,4 @@
+import math
 import numpy as np
 
 def reflect_y(XX, YY):
@@ -12,22 +13,60 @@ def translate(Xtemp, Ytemp, X_0, Y_0):
 
 def rotate(Xtemp, Ytemp, ANGLE):
     """Rotates coordinates around the origin by a given ANGLE in radians."""
-    XX = np.cos(ANGLE) * Xtemp - np.sin(ANGLE) * Ytemp
-    YY = np.sin(ANGLE) * Xtemp + np.cos(ANGLE) * Ytemp
+    COS, SIN = np.cos(ANGLE), np.sin(ANGLE)
+    return COS * Xtemp - SIN * Ytemp, SIN * Xtemp + COS * Ytemp
+
+def affine(Xtemp, Ytemp, ANGLE, X_0=0.0, Y_0=0.0):
+    """
+    Rotates coordinates around the origin by ANGLE and then translates them by (X_0, Y_0).
+    Equivalent to translate(*rotate(Xtemp, Ytemp, ANGLE), X_0, Y_0), but the trig terms
+    are evaluated once and the result is accumulated in place in the output buffers.
+    """
+    COS, SIN = np.cos(ANGLE), np.sin(ANGLE)
+    XX = COS * Xtemp
+    XX -= SIN * Ytemp
+    YY = COS * Ytemp
+    YY += SIN * Xtemp
+    if X_0 != 0 or Y_0 != 0:
+        XX += X_0
+        YY += Y_0
     return XX, YY
 
-def create_circular_pattern(X_tooth, Y_tooth, Z, P_ANGLE, ALIGN_ANGLE):
-    """Creates a full gear by rotating a single tooth profile."""
-    all_X = []
-    all_Y = []
+def rotate_pattern(X_tooth, Y_tooth, P_ANGLE, count, X_0=0.0, Y_0=0.0, START_ANGLE=0.0):
+    """
+    Rotates a tooth profile to `count` positions spaced P_ANGLE apart, starting at
+    START_ANGLE, and translates the result by (X_0, Y_0). All positions are computed
+    in one broadcast pass and returned as two (count, N) arrays, one row per tooth.
+    """
+    angles = P_ANGLE * np.arange(int(count))
+    angles += START_ANGLE
+    return affine(X_tooth[np.newaxis, :], Y_tooth[np.newaxis, :], angles[:, np.newaxis], X_0, Y_0)
+
+def mesh_gear_pair(gear1_data, gear2_data, center_dist, X_0=0.0, Y_0=0.0):
+    """
+    Places both gears of a pair in their meshing position.
+    Gear 1 is centered at (X_0, Y_0) and gear 2 at (X_0 + center_dist, Y_0), turned by
+    half a pitch plus pi so that its teeth fall into the tooth spaces of gear 1.
 
-    # Apply initial alignment rotation to the first tooth
-    X_rot, Y_rot = rotate(X_tooth, Y_tooth, ALIGN_ANGLE)
+    Args:
+        gear1_data (tuple): (X_tooth, Y_tooth, Z, P_ANGLE, ALIGN_ANGLE) for gear 1.
+        gear2_data (tuple): (X_tooth, Y_tooth, Z, P_ANGLE, ALIGN_ANGLE) for gear 2.
 
-    for i in range(int(Z)):
-        # Rotate the aligned tooth to its final position
-        X_final, Y_final = rotate(X_rot, Y_rot, P_ANGLE * i)
-        all_X.append(X_final)
-        all_Y.append(Y_final)
+    Returns:
+        tuple: ((X_all1, Y_all1), (X_all2, Y_all2)), each a pair of (Z, N) arrays.
+    """
+    # The alignment rotations are folded into the pattern angles rather than applied
+    # to the tooth profile in a separate pass
+    X_tooth1, Y_tooth1, Z1, P_ANGLE1, ALIGN_ANGLE1 = gear1_data
+    gear1 = rotate_pattern(X_tooth1, Y_tooth1, P_ANGLE1, Z1, X_0, Y_0, ALIGN_ANGLE1)
 
-    return all_X, all_Y
\ No newline at end of file
+    X_tooth2, Y_tooth2, Z2, P_ANGLE2, ALIGN_ANGLE2 = gear2_data
+    initial_rotation2 = math.pi + (math.pi / Z2)
+    gear2 = rotate_pattern(X_tooth2, Y_tooth2, P_ANGLE2, Z2, X_0 + center_dist, Y_0, ALIGN_ANGLE2 + initial_rotation2)
+    return gear1, gear2
+
+def create_circular_pattern(X_tooth, Y_tooth, Z, P_ANGLE, ALIGN_ANGLE):
+    """Creates a full gear by rotating a single tooth profile."""
+    # Rotate the tooth to every final position at once, including the initial alignment
+    all_X, all_Y = rotate_pattern(X_tooth, Y_tooth, P_ANGLE, Z, START_ANGLE=ALIGN_ANGLE)
+    return list(all_X), list(all_Y)
@@ -1,4 +1,7 @@
+import functools
+import operator
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk, filedialog, messagebox
 import os
 
@@ -9,10 +12,82 @@ except ImportError:
     PIL_AVAILABLE = False
 
 # Import the refactored modules
-from ..core import gear_math, geometry_generator
+from ..core import gear_math, geometry_generator, transformations
 from ..io import dxf_exporter, image_exporter
 from ..utils import config_manager
 
+RUN_POLL_INTERVAL_MS = 50
+
+# The logo lives in the parent directory of the project root
+_LOGO_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'FGPG2-05', 'FGPG2.png')
+
+# Calculation parameters as (params key, UI variable key, type), converted in this order
+CALCULATION_PARAM_FIELDS = (
+    ('M', 'module_m', float), ('Z', 'teeth_number_z', int),
+    ('ALPHA', 'pressure_angle_alpha', float), ('X', 'offset_factor_x', float),
+    ('B', 'backlash_factor_b', float), ('A', 'addendum_factor_a', float),
+    ('D', 'dedendum_factor_d', float), ('C', 'hob_edge_radius_c', float),
+    ('E', 'tooth_edge_radius_e', float), ('X_0', 'x_0', float),
+    ('Y_0', 'y_0', float),
+    ('SEG_INVOLUTE', 'seg_involute', int), ('SEG_EDGE_R', 'seg_edge_r', int),
+    ('SEG_ROOT_R', 'seg_root_r', int), ('SEG_OUTER', 'seg_outer', int),
+    ('SEG_ROOT', 'seg_root', int),
+    ('z2', 'teeth_number_z2', int), ('x2', 'offset_factor_x2', float),
+)
+
+# Parameters that determine the generated tooth geometry. Presentation-only values
+# (gear center, working directory) are excluded so that changing them reuses it.
+GEOMETRY_PARAM_KEYS = ('M', 'Z', 'ALPHA', 'X', 'B', 'A', 'D', 'C', 'E',
+                       'SEG_INVOLUTE', 'SEG_EDGE_R', 'SEG_ROOT_R', 'SEG_OUTER', 'SEG_ROOT', 'z2', 'x2')
+_get_geometry_values = operator.itemgetter(*GEOMETRY_PARAM_KEYS)
+
+# Files written by a Run, checked before an unchanged Run skips the export
+EXPORT_FILENAMES = (image_exporter.PREVIEW_FILENAME, dxf_exporter.DXF_FILENAME)
+
+def _get_output_stats(working_dir):
+    """Returns (mtime_ns, size) of each exported file, or None if one is missing."""
+    try:
+        return tuple((stat.st_mtime_ns, stat.st_size)
+                     for stat in (os.stat(os.path.join(working_dir, name)) for name in EXPORT_FILENAMES))
+    except FileNotFoundError:
+        return None
+
+# Entry fields as (key, label, default, unit); defaults are kept as the strings shown in the UI
+SPEC_FIELDS = (
+    ("module_m", "Module, m", "1.0", "[mm], (>0)"),
+    ("teeth_number_z", "Teeth Number, z1", "18", "[ea], (+/-)"),
+    ("pressure_angle_alpha", "Pressure Angle, alpha", "20.0", "[deg]"),
+    ("offset_factor_x", "Offset Factor, x1", "0.2", "(-1~+1)"),
+    ("backlash_factor_b", "Backlash Factor, b", "0.05", "(0~1)"),
+    ("addendum_factor_a", "Addendum Factor, a", "1.0", "(0~1)"),
+    ("dedendum_factor_d", "Dedendum Factor, d", "1.25", "(0~1)"),
+    ("hob_edge_radius_c", "Hob Edge Radius, c", "0.2", ""),
+    ("tooth_edge_radius_e", "Tooth Edge Radius, e", "0.1", ""),
+)
+MATING_FIELDS = (
+    ("teeth_number_z2", "Teeth Number, z2", "36", "[ea]"),
+    ("offset_factor_x2", "Offset Factor, x2", "0.0", ""),
+)
+GRAPHIC_FIELDS = (
+    ("x_0", "Center, x_0", "0.0", "[mm]"),
+    ("y_0", "Center, y_0", "0.0", "[mm]"),
+    ("seg_involute", "Seg, involute", "15", "[ea]"),
+    ("seg_edge_r", "Seg, edge_r", "15", "[ea]"),
+    ("seg_root_r", "Seg, root_r", "15", "[ea]"),
+    ("seg_outer", "Seg, outer", "5", "[ea]"),
+    ("seg_root", "Seg, root", "5", "[ea]"),
+)
+
+@functools.lru_cache(maxsize=8)
+def _generate_gear_pair_cached(geometry_values):
+    """Generates (or returns the cached) gear pair for a tuple of GEOMETRY_PARAM_KEYS values."""
+    gear_pair = geometry_generator.generate_gear_pair(dict(zip(GEOMETRY_PARAM_KEYS, geometry_values)))
+    # The arrays are shared between runs, so protect them against accidental modification
+    for X_tooth, Y_tooth, *_ in gear_pair:
+        X_tooth.flags.writeable = False
+        Y_tooth.flags.writeable = False
+    return gear_pair
+
 class GearApp(tk.Tk):
     def __init__(self):
         super().__init__()
@@ -20,9 +95,12 @@ class GearApp(tk.Tk):
         self.geometry("950x700")
 
         self.vars = {}
-        self.current_image_path = "Result1.png"
+        self.current_image_path = image_exporter.PREVIEW_FILENAME
         self.logo_image = None
         self.result_image = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._run_future = None
+        self._last_export = None  # (export key, output stats); only accessed from the worker thread
 
         main_frame = ttk.Frame(self, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -42,39 +120,25 @@ class GearApp(tk.Tk):
         self.create_control_widgets(right_frame)
         self.load_logo_image()
 
-    def create_entry(self, parent, row, key, label, default_val, unit):
-        ttk.Label(parent, text=f"{label} =").grid(row=row, column=0, sticky="w", pady=2)
-        var = tk.StringVar(value=str(default_val))
-        self.vars[key] = var
-        ttk.Entry(parent, textvariable=var, width=10).grid(row=row, column=1, padx=5)
-        ttk.Label(parent, text=unit).grid(row=row, column=2, sticky="w")
+    def create_entries(self, parent, fields):
+        """Creates a label/entry/unit row and its StringVar for every (key, label, default, unit) field."""
+        StringVar, Label, Entry = tk.StringVar, ttk.Label, ttk.Entry
+        variables = self.vars
+        for row, (key, label, default_val, unit) in enumerate(fields):
+            var = variables[key] = StringVar(value=default_val)
+            Label(parent, text=f"{label} =").grid(row=row, column=0, sticky="w", pady=2)
+            Entry(parent, textvariable=var, width=10).grid(row=row, column=1, padx=5)
+            Label(parent, text=unit).grid(row=row, column=2, sticky="w")
 
     def create_spec_widgets(self, parent):
         frame = ttk.LabelFrame(parent, text="1. Gear Spec (Gear 1)", padding="10")
         frame.grid(row=0, column=0, sticky="ew", pady=5)
-        specs = [
-            ("module_m", "Module, m", 1.0, "[mm], (>0)"),
-            ("teeth_number_z", "Teeth Number, z1", 18, "[ea], (+/-)"),
-            ("pressure_angle_alpha", "Pressure Angle, alpha", 20.0, "[deg]"),
-            ("offset_factor_x", "Offset Factor, x1", 0.2, "(-1~+1)"),
-            ("backlash_factor_b", "Backlash Factor, b", 0.05, "(0~1)"),
-            ("addendum_factor_a", "Addendum Factor, a", 1.0, "(0~1)"),
-            ("dedendum_factor_d", "Dedendum Factor, d", 1.25, "(0~1)"),
-            ("hob_edge_radius_c", "Hob Edge Radius, c", 0.2, ""),
-            ("tooth_edge_radius_e", "Tooth Edge Radius, e", 0.1, "")
-        ]
-        for i, (key, label, val, unit) in enumerate(specs):
-            self.create_entry(frame, i, key, label, val, unit)
+        self.create_entries(frame, SPEC_FIELDS)
 
     def create_mating_gear_widgets(self, parent):
         frame = ttk.LabelFrame(parent, text="1.5. Mating Gear Spec (Gear 2)", padding="10")
         frame.grid(row=1, column=0, sticky="ew", pady=5)
-        specs = [
-            ("teeth_number_z2", "Teeth Number, z2", 36, "[ea]"),
-            ("offset_factor_x2", "Offset Factor, x2", 0.0, ""),
-        ]
-        for i, (key, label, val, unit) in enumerate(specs):
-            self.create_entry(frame, i, key, label, val, unit)
+        self.create_entries(frame, MATING_FIELDS)
 
     def create_analysis_widgets(self, parent):
         frame = ttk.LabelFrame(parent, text="Analysis", padding="10")
@@ -89,17 +153,7 @@ class GearApp(tk.Tk):
     def create_graphics_widgets(self, parent):
         frame = ttk.LabelFrame(parent, text="2. Graphics & Misc.", padding="10")
         frame.grid(row=3, column=0, sticky="ew", pady=5)
-        graphics = [
-            ("x_0", "Center, x_0", 0.0, "[mm]"),
-            ("y_0", "Center, y_0", 0.0, "[mm]"),
-            ("seg_involute", "Seg, involute", 15, "[ea]"),
-            ("seg_edge_r", "Seg, edge_r", 15, "[ea]"),
-            ("seg_root_r", "Seg, root_r", 15, "[ea]"),
-            ("seg_outer", "Seg, outer", 5, "[ea]"),
-            ("seg_root", "Seg, root", 5, "[ea]"),
-        ]
-        for i, (key, label, val, unit) in enumerate(graphics):
-            self.create_entry(frame, i, key, label, val, unit)
+        self.create_entries(frame, GRAPHIC_FIELDS)
 
     def create_control_widgets(self, parent):
         dir_frame = ttk.Frame(parent)
@@ -120,7 +174,8 @@ class GearApp(tk.Tk):
         btn_frame = ttk.Frame(parent)
         btn_frame.grid(row=3, column=0, sticky="ew")
         ttk.Button(btn_frame, text="Load", command=self.load_params_from_file).pack(side="left", padx=5)
-        ttk.Button(btn_frame, text="Run", command=self.run_calculation).pack(side="left", padx=5)
+        self.run_button = ttk.Button(btn_frame, text="Run", command=self.run_calculation)
+        self.run_button.pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Save", command=self.save_params_to_file).pack(side="left", padx=5)
         ttk.Button(btn_frame, text="Exit", command=self.quit).pack(side="left", padx=5)
 
@@ -128,18 +183,15 @@ class GearApp(tk.Tk):
         if not PIL_AVAILABLE:
             self.image_label.config(text="Pillow library not found. Image preview is disabled.")
             return
-        # The logo is now in the parent directory of the project root
-        logo_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'FGPG2-05', 'FGPG2.png')
-        if os.path.exists(logo_path):
-            try:
-                img = Image.open(logo_path)
+        try:
+            with Image.open(_LOGO_PATH) as img:
                 img.thumbnail((500, 500))
                 self.logo_image = ImageTk.PhotoImage(img)
-                self.image_label.config(image=self.logo_image)
-            except Exception as e:
-                self.status_var.set(f"Info: Could not load logo. {e}")
-        else:
+            self.image_label.config(image=self.logo_image)
+        except FileNotFoundError:
             self.status_var.set("Info: Logo image not found.")
+        except Exception as e:
+            self.status_var.set(f"Info: Could not load logo. {e}")
 
     def browse_dir(self):
         dir_name = filedialog.askdirectory()
@@ -147,20 +199,9 @@ class GearApp(tk.Tk):
             self.vars['working_directory'].set(dir_name)
 
     def get_params_from_ui(self):
+        variables = self.vars
         try:
-            params = {
-                'M': float(self.vars['module_m'].get()), 'Z': int(self.vars['teeth_number_z'].get()),
-                'ALPHA': float(self.vars['pressure_angle_alpha'].get()), 'X': float(self.vars['offset_factor_x'].get()),
-                'B': float(self.vars['backlash_factor_b'].get()), 'A': float(self.vars['addendum_factor_a'].get()),
-                'D': float(self.vars['dedendum_factor_d'].get()), 'C': float(self.vars['hob_edge_radius_c'].get()),
-                'E': float(self.vars['tooth_edge_radius_e'].get()), 'X_0': float(self.vars['x_0'].get()),
-                'Y_0': float(self.vars['y_0'].get()),
-                'SEG_INVOLUTE': int(self.vars['seg_involute'].get()), 'SEG_EDGE_R': int(self.vars['seg_edge_r'].get()),
-                'SEG_ROOT_R': int(self.vars['seg_root_r'].get()), 'SEG_OUTER': int(self.vars['seg_outer'].get()),
-                'SEG_ROOT': int(self.vars['seg_root'].get()),
-                'z2': int(self.vars['teeth_number_z2'].get()), 'x2': float(self.vars['offset_factor_x2'].get())
-            }
-            return params
+            return {calc_key: convert(variables[ui_key].get()) for calc_key, ui_key, convert in CALCULATION_PARAM_FIELDS}
         except (ValueError, KeyError) as e:
             messagebox.showerror("Input Error", f"Invalid or missing input value for {e}")
             return None
@@ -168,49 +209,74 @@ class GearApp(tk.Tk):
     def run_calculation(self):
         params = self.get_params_from_ui()
         if not params: return
+        if self._run_future is not None: return  # A run is already in progress
 
         working_dir = self.vars['working_directory'].get()
+
+        # Calculation and export run on a worker thread so the window stays responsive;
+        # the result is picked up on the Tk thread by polling in _finish_calculation.
+        self.run_button.state(['disabled'])
+        self.status_var.set("Run: Calculating...")
+        self._run_future = self._executor.submit(self._calculate_and_export, params, working_dir)
+        self.after(RUN_POLL_INTERVAL_MS, self._finish_calculation)
+
+    def _calculate_and_export(self, params, working_dir):
+        """Worker-thread part of a Run. Must not touch any Tk widget or variable."""
         os.makedirs(working_dir, exist_ok=True)
 
-        try:
-            # --- Perform Calculations ---
-            contact_ratio, center_dist = gear_math.calculate_contact_ratio(
-                params['M'], params['Z'], params['z2'], params['X'], params['x2'], params['ALPHA'], params['A'])
-
-            undercut_status1 = gear_math.check_undercut(params['Z'], params['ALPHA'], params['X'], params['A'])
-            undercut_status2 = gear_math.check_undercut(params['z2'], params['ALPHA'], params['X'], params['A'])
-
-            # --- Generate Geometry ---
-            gear1_profile = geometry_generator.generate_tooth_profile(
-                params['M'], params['Z'], params['ALPHA'], params['X'], params['B'],
-                params['A'], params['D'], params['C'], params['E'],
-                params['SEG_INVOLUTE'], params['SEG_EDGE_R'], params['SEG_ROOT_R'],
-                params['SEG_OUTER'], params['SEG_ROOT'])
-
-            gear2_profile = geometry_generator.generate_tooth_profile(
-                params['M'], params['z2'], params['ALPHA'], params['x2'], params['B'],
-                params['A'], params['D'], params['C'], params['E'],
-                params['SEG_INVOLUTE'], params['SEG_EDGE_R'], params['SEG_ROOT_R'],
-                params['SEG_OUTER'], params['SEG_ROOT'])
-
-            # --- Export Files ---
+        # --- Perform Calculations ---
+        contact_ratio, center_dist = gear_math.calculate_contact_ratio(
+            params['M'], params['Z'], params['z2'], params['X'], params['x2'], params['ALPHA'], params['A'])
+
+        undercut_status1 = gear_math.check_undercut(params['Z'], params['ALPHA'], params['X'], params['A'])
+        undercut_status2 = gear_math.check_undercut(params['z2'], params['ALPHA'], params['X'], params['A'])
+
+        # --- Generate Geometry ---
+        gear1_profile, gear2_profile = _generate_gear_pair_cached(_get_geometry_values(params))
+
+        # --- Export Files ---
+        # Identical parameters produce identical files, so only export when they changed
+        # or when a previous output has since been replaced or removed
+        export_key = (tuple(sorted(params.items())), working_dir)
+        last_export = self._last_export
+        if (last_export is None or last_export[0] != export_key
+                or last_export[1] != _get_output_stats(working_dir)):
+            self._last_export = None
+            gear_patterns = transformations.mesh_gear_pair(gear1_profile, gear2_profile, center_dist, params['X_0'], params['Y_0'])
             image_exporter.export_gear_pair_to_image(
                 working_dir, gear1_profile, gear2_profile, center_dist,
-                params['M'], params['Z'], params['z2'], params['X_0'], params['Y_0'])
+                params['M'], params['Z'], params['z2'], params['X_0'], params['Y_0'],
+                preview=True, gear_patterns=gear_patterns)
 
             dxf_exporter.export_gear_pair_to_dxf(
                 working_dir, gear1_profile, gear2_profile, center_dist,
-                params['X_0'], params['Y_0'])
+                params['X_0'], params['Y_0'], gear_patterns=gear_patterns)
+            output_stats = _get_output_stats(working_dir)
+            if output_stats is not None:
+                self._last_export = (export_key, output_stats)
 
-            # --- Update UI ---
-            self.vars['contact_ratio'].set(f"{contact_ratio:.4f}")
-            self.vars['center_distance'].set(f"{center_dist:.4f} mm")
-            self.status_var.set(f"Run: OK. G1 Undercut: {undercut_status1}. G2 Undercut: {undercut_status2}")
-            self.display_result_image()
+        return contact_ratio, center_dist, undercut_status1, undercut_status2
 
+    def _finish_calculation(self):
+        future = self._run_future
+        if not future.done():
+            self.after(RUN_POLL_INTERVAL_MS, self._finish_calculation)
+            return
+        self._run_future = None
+        self.run_button.state(['!disabled'])
+
+        try:
+            contact_ratio, center_dist, undercut_status1, undercut_status2 = future.result()
         except Exception as e:
             messagebox.showerror("Calculation Error", f"An error occurred: {e}")
             self.status_var.set(f"Run: Failed. {e}")
+            return
+
+        # --- Update UI ---
+        self.vars['contact_ratio'].set(f"{contact_ratio:.4f}")
+        self.vars['center_distance'].set(f"{center_dist:.4f} mm")
+        self.status_var.set(f"Run: OK. G1 Undercut: {undercut_status1}. G2 Undercut: {undercut_status2}")
+        self.display_result_image()
 
     def display_result_image(self):
         if not PIL_AVAILABLE:
@@ -219,18 +285,30 @@ class GearApp(tk.Tk):
         try:
             working_dir = self.vars['working_directory'].get()
             img_path = os.path.join(working_dir, self.current_image_path)
-            if os.path.exists(img_path):
-                img = Image.open(img_path)
-                img.thumbnail((500, 500))
-                self.result_image = ImageTk.PhotoImage(img)
-                self.image_label.config(image=self.result_image)
-            else:
-                # If image not found, revert to logo
-                self.image_label.config(image=self.logo_image)
-                self.status_var.set(f"Image not found: {img_path}")
+            preview_box = (image_exporter.PREVIEW_SIZE, image_exporter.PREVIEW_SIZE)
+            # The file handle is closed as soon as the pixels have been handed to Tk
+            with Image.open(img_path) as img:
+                # Let the JPEG decoder scale down while decoding (no-op for other formats)
+                img.draft('RGB', preview_box)
+                img.thumbnail(preview_box)
+                new_image = ImageTk.PhotoImage(img)
+            self._release_result_image()
+            self.result_image = new_image
+            self.image_label.config(image=self.result_image)
+        except FileNotFoundError:
+            # If image not found, revert to logo
+            self._release_result_image()
+            self.image_label.config(image=self.logo_image)
+            self.status_var.set(f"Image not found: {img_path}")
         except Exception as e:
             self.status_var.set(f"Error displaying image: {e}")
 
+    def _release_result_image(self):
+        """Detaches the previous result preview from the label so Tk frees its pixmap right away."""
+        if self.result_image is not None:
+            self.image_label.config(image='')
+            self.result_image = None
+
     def save_params_to_file(self):
         working_dir = self.vars['working_directory'].get()
         data_to_save = {key: var.get() for key, var in self.vars.items() if key != 'working_directory'}
@@ -244,8 +322,9 @@ class GearApp(tk.Tk):
         success, data_or_error = config_manager.load_params(working_dir)
         if success:
             for key, value in data_or_error.items():
-                if key in self.vars:
-                    self.vars[key].set(value)
+                var = self.vars.get(key)  # Unknown keys from older or edited files are ignored
+                if var is not None:
+                    var.set(value)
             self.status_var.set("Load: OK")
         else:
             messagebox.showerror("Load Error", data_or_error)
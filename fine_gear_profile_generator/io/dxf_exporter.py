@@ -1,9 +1,10 @@
-import ezdxf
 import numpy as np
 import os
 from ..core import transformations
 
-def export_gear_pair_to_dxf(working_dir, gear1_data, gear2_data, center_dist, x_offset, y_offset):
+DXF_FILENAME = 'Result_Gear_Pair.dxf'
+
+def export_gear_pair_to_dxf(working_dir, gear1_data, gear2_data, center_dist, x_offset, y_offset, gear_patterns=None, binary=False):
     """
     Exports a pair of gears to a DXF file.
 
@@ -14,37 +15,34 @@ def export_gear_pair_to_dxf(working_dir, gear1_data, gear2_data, center_dist, x_
         center_dist (float): The distance between the centers of the two gears.
         x_offset (float): The X-coordinate of the center of the first gear.
         y_offset (float): The Y-coordinate of the center of the first gear.
+        gear_patterns (tuple, optional): Result of transformations.mesh_gear_pair for these
+            arguments, to reuse gear positions already computed for another export.
+        binary (bool): Write a binary DXF. It is about half the size of the default ASCII
+            DXF and faster to write, but not every CAD/CAM tool can read it.
     """
+    # ezdxf is imported on first use so that starting the GUI does not pay for it
+    import ezdxf
+
     doc = ezdxf.new('R2000')
     msp = doc.modelspace()
 
+    # Both gears are placed in their meshing position, unless the caller already did so
+    if gear_patterns is None:
+        gear_patterns = transformations.mesh_gear_pair(gear1_data, gear2_data, center_dist, x_offset, y_offset)
+    (X_all1, Y_all1), (X_all2, Y_all2) = gear_patterns
+
     # --- Draw Gear 1 ---
-    X_tooth1, Y_tooth1, Z1, P_ANGLE1, ALIGN_ANGLE1 = gear1_data
-    # First, align the tooth profile
-    X_rot1, Y_rot1 = transformations.rotate(X_tooth1, Y_tooth1, ALIGN_ANGLE1)
-    # Then, create the full gear by rotating the single tooth
-    for i in range(int(Z1)):
-        X_temp, Y_temp = transformations.rotate(X_rot1, Y_rot1, P_ANGLE1 * i)
-        # Finally, move the gear to its final position
-        X_final, Y_final = transformations.translate(X_temp, Y_temp, x_offset, y_offset)
-        msp.add_lwpolyline(list(zip(X_final, Y_final)), close=True, dxfattribs={'color': 5})  # Blue
+    # Vertex lists for all teeth are materialized at once by NumPy rather than via zip()
+    for points in np.stack((X_all1, Y_all1), axis=-1).tolist():
+        msp.add_lwpolyline(points, format='xy', close=True, dxfattribs={'color': 5})  # Blue
 
     # --- Draw Gear 2 ---
-    X_tooth2, Y_tooth2, Z2, P_ANGLE2, ALIGN_ANGLE2 = gear2_data
-    # The second gear needs an initial rotation to mesh correctly
-    initial_rotation2 = np.pi + (np.pi / Z2)
-    # First, align the tooth profile with the initial meshing rotation
-    X_rot2, Y_rot2 = transformations.rotate(X_tooth2, Y_tooth2, ALIGN_ANGLE2 + initial_rotation2)
-    # Then, create the full gear
-    for i in range(int(Z2)):
-        X_temp, Y_temp = transformations.rotate(X_rot2, Y_rot2, P_ANGLE2 * i)
-        # Finally, move the gear to its final position (offset by center distance)
-        X_final, Y_final = transformations.translate(X_temp, Y_temp, x_offset + center_dist, y_offset)
-        msp.add_lwpolyline(list(zip(X_final, Y_final)), close=True, dxfattribs={'color': 1})  # Red
+    for points in np.stack((X_all2, Y_all2), axis=-1).tolist():
+        msp.add_lwpolyline(points, format='xy', close=True, dxfattribs={'color': 1})  # Red
 
     # Save the DXF file
-    output_path = os.path.join(working_dir, 'Result_Gear_Pair.dxf')
+    output_path = os.path.join(working_dir, DXF_FILENAME)
     try:
-        doc.saveas(output_path)
+        doc.saveas(output_path, fmt='bin' if binary else 'asc')
     except IOError:
         print(f"Error: Could not save DXF file to {output_path}.")
\ No newline at end of file
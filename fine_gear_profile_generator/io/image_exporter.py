@@ -1,10 +1,38 @@
 import os
-import matplotlib.pyplot as plt
+import threading
+import numpy as np
 from ..core import transformations
 
-def export_gear_pair_to_image(working_dir, gear1_data, gear2_data, center_dist, m_val, z1_val, z2_val, x_offset=0.0, y_offset=0.0):
+IMAGE_FILENAME = 'Result1.png'
+PREVIEW_FILENAME = 'Result1.jpg'
+PREVIEW_SIZE = 500  # [px], matches the GUI preview area
+
+# The preview figure is built once on an Agg canvas and cleared between exports.
+# It never goes through pyplot, so it needs no display and no backend switching;
+# the lock keeps concurrent exports from drawing on the shared axes at once.
+_FIGURE = None
+_AXES = None
+_FIGURE_LOCK = threading.Lock()
+
+def _get_preview_axes():
+    """Returns the cached preview figure and axes, cleared and ready for drawing."""
+    global _FIGURE, _AXES
+    if _FIGURE is None:
+        # Matplotlib is imported on first use so that starting the GUI does not pay for it
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        _FIGURE = Figure(figsize=(8, 8))
+        FigureCanvasAgg(_FIGURE)
+        _AXES = _FIGURE.add_subplot(111)
+    else:
+        _AXES.cla()
+    return _FIGURE, _AXES
+
+def export_gear_pair_to_image(working_dir, gear1_data, gear2_data, center_dist, m_val, z1_val, z2_val, x_offset=0.0, y_offset=0.0, preview=False, gear_patterns=None):
     """
     Generates and saves a PNG image preview of the gear pair.
+    With preview=True a JPEG sized for the GUI preview area is written instead,
+    which is much cheaper to encode and decode than the full-size PNG.
 
     Args:
         working_dir (str): Directory to save the image.
@@ -16,43 +44,42 @@ def export_gear_pair_to_image(working_dir, gear1_data, gear2_data, center_dist,
         z2_val (int): Number of teeth for gear 2.
         x_offset (float): X-coordinate of the center of the first gear.
         y_offset (float): Y-coordinate of the center of the first gear.
+        preview (bool): Save a PREVIEW_SIZE px JPEG instead of the 800 px PNG.
+        gear_patterns (tuple, optional): Result of transformations.mesh_gear_pair for these
+            arguments, to reuse gear positions already computed for another export.
+
+    Returns:
+        str: The path of the saved image file.
     """
-    if 'DISPLAY' not in os.environ and 'XDG_SESSION_TYPE' not in os.environ:
-        plt.switch_backend('Agg')
-
-    fig = plt.figure(figsize=(8, 8))
-    ax = fig.add_subplot(111)
-    ax.set_aspect('equal')
-    ax.set_title('Fine Gear Profile Generator - Gear Pair Preview')
-    ax.grid(True)
-
-    # --- Plot Gear 1 ---
-    X_tooth1, Y_tooth1, Z1, P_ANGLE1, ALIGN_ANGLE1 = gear1_data
-    X_rot1, Y_rot1 = transformations.rotate(X_tooth1, Y_tooth1, ALIGN_ANGLE1)
-    for i in range(int(Z1)):
-        X_temp, Y_temp = transformations.rotate(X_rot1, Y_rot1, P_ANGLE1 * i)
-        X_final, Y_final = transformations.translate(X_temp, Y_temp, x_offset, y_offset)
-        ax.plot(X_final, Y_final, '-', linewidth=1.5, color='blue')
-
-    # --- Plot Gear 2 ---
-    X_tooth2, Y_tooth2, Z2, P_ANGLE2, ALIGN_ANGLE2 = gear2_data
-    import numpy as np
-    initial_rotation2 = np.pi + (np.pi / Z2)
-    X_rot2, Y_rot2 = transformations.rotate(X_tooth2, Y_tooth2, ALIGN_ANGLE2 + initial_rotation2)
-    for i in range(int(Z2)):
-        X_temp, Y_temp = transformations.rotate(X_rot2, Y_rot2, P_ANGLE2 * i)
-        X_final, Y_final = transformations.translate(X_temp, Y_temp, x_offset + center_dist, y_offset)
-        ax.plot(X_final, Y_final, '-', linewidth=1.5, color='red')
-
-    # Set plot limits for a good view
-    ax.set_xlim(-m_val * z1_val / 1.5, center_dist + m_val * z2_val / 1.5)
-    ax.set_ylim(-m_val * max(z1_val, z2_val) * 1.2, m_val * max(z1_val, z2_val) * 1.2)
-
-    # Save the figure
-    output_path = os.path.join(working_dir, 'Result1.png')
-    try:
-        fig.savefig(output_path, dpi=100)
-    except Exception as e:
-        print(f"Error saving image: {e}")
-    finally:
-        plt.close(fig) # Ensure the figure is closed to free memory
\ No newline at end of file
+    from matplotlib.collections import LineCollection
+
+    with _FIGURE_LOCK:
+        fig, ax = _get_preview_axes()
+        ax.set_aspect('equal')
+        ax.set_title('Fine Gear Profile Generator - Gear Pair Preview')
+        ax.grid(True)
+
+        if gear_patterns is None:
+            gear_patterns = transformations.mesh_gear_pair(gear1_data, gear2_data, center_dist, x_offset, y_offset)
+        (X_all1, Y_all1), (X_all2, Y_all2) = gear_patterns
+
+        # Each gear is drawn as a single LineCollection with one segment per tooth,
+        # rather than one Line2D artist per tooth.
+        ax.add_collection(LineCollection(np.stack((X_all1, Y_all1), axis=-1), linewidths=1.5, colors='blue'))
+        ax.add_collection(LineCollection(np.stack((X_all2, Y_all2), axis=-1), linewidths=1.5, colors='red'))
+
+        # Set plot limits for a good view
+        ax.set_xlim(-m_val * z1_val / 1.5, center_dist + m_val * z2_val / 1.5)
+        ax.set_ylim(-m_val * max(z1_val, z2_val) * 1.2, m_val * max(z1_val, z2_val) * 1.2)
+
+        # Save the figure
+        try:
+            if preview:
+                output_path = os.path.join(working_dir, PREVIEW_FILENAME)
+                fig.savefig(output_path, dpi=PREVIEW_SIZE / fig.get_figwidth(), format='jpeg', pil_kwargs={'quality': 85})
+            else:
+                output_path = os.path.join(working_dir, IMAGE_FILENAME)
+                fig.savefig(output_path, dpi=100)
+        except Exception as e:
+            print(f"Error saving image: {e}")
+        return output_path
\ No newline at end of file
@@ -1,15 +1,12 @@
 import argparse
 import sys
-import tkinter as tk
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # By using relative imports, we treat this project as a package.
 # This script should be run as a module from the parent directory, e.g.:
 # python -m fine_gear_profile_generator.main
-try:
-    from .gui.fgpg_gui import GearApp
-    # In the future, headless mode would import from .core, .io, etc.
-except ImportError:
+if __package__ in (None, ''):
     print("Error: Failed to import application modules.", file=sys.stderr)
     print("Please run this script as a module from the project's parent directory.", file=sys.stderr)
     print("Example: python -m fine_gear_profile_generator.main", file=sys.stderr)
@@ -36,7 +33,7 @@ def run_headless_mode():
     os.makedirs(working_dir, exist_ok=True)
 
     try:
-        from .core import gear_math, geometry_generator
+        from .core import gear_math, geometry_generator, transformations
         from .io import dxf_exporter, image_exporter
 
         # --- Perform Calculations ---
@@ -44,26 +41,24 @@ def run_headless_mode():
             params['M'], params['Z'], params['z2'], params['X'], params['x2'], params['ALPHA'], params['A'])
 
         # --- Generate Geometry ---
-        gear1_profile = geometry_generator.generate_tooth_profile(
-            params['M'], params['Z'], params['ALPHA'], params['X'], params['B'],
-            params['A'], params['D'], params['C'], params['E'],
-            params['SEG_INVOLUTE'], params['SEG_EDGE_R'], params['SEG_ROOT_R'],
-            params['SEG_OUTER'], params['SEG_ROOT'])
-
-        gear2_profile = geometry_generator.generate_tooth_profile(
-            params['M'], params['z2'], params['ALPHA'], params['x2'], params['B'],
-            params['A'], params['D'], params['C'], params['E'],
-            params['SEG_INVOLUTE'], params['SEG_EDGE_R'], params['SEG_ROOT_R'],
-            params['SEG_OUTER'], params['SEG_ROOT'])
+        gear1_profile, gear2_profile = geometry_generator.generate_gear_pair(params)
+        gear_patterns = transformations.mesh_gear_pair(gear1_profile, gear2_profile, center_dist, params['X_0'], params['Y_0'])
 
         # --- Export Files ---
-        image_exporter.export_gear_pair_to_image(
-            working_dir, gear1_profile, gear2_profile, center_dist,
-            params['M'], params['Z'], params['z2'], params['X_0'], params['Y_0'])
-
-        dxf_exporter.export_gear_pair_to_dxf(
-            working_dir, gear1_profile, gear2_profile, center_dist,
-            params['X_0'], params['Y_0'])
+        # The exports are independent; the DXF is written while Pillow encodes the PNG,
+        # which releases the GIL
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            image_future = executor.submit(
+                image_exporter.export_gear_pair_to_image,
+                working_dir, gear1_profile, gear2_profile, center_dist,
+                params['M'], params['Z'], params['z2'], params['X_0'], params['Y_0'], gear_patterns=gear_patterns)
+
+            dxf_future = executor.submit(
+                dxf_exporter.export_gear_pair_to_dxf,
+                working_dir, gear1_profile, gear2_profile, center_dist,
+                params['X_0'], params['Y_0'], gear_patterns=gear_patterns)
+            image_future.result()
+            dxf_future.result()
 
         print(f"Headless run complete. Files saved in {working_dir}")
 
@@ -93,7 +88,10 @@ def main():
     if args.headless:
         run_headless_mode()
     else:
-        # Launch the GUI application
+        # Launch the GUI application. Tk and the GUI module are only imported here, so
+        # headless runs do not load them.
+        import tkinter as tk
+        from .gui.fgpg_gui import GearApp
         try:
             app = GearApp()
             app.mainloop()
@@ -0,0 +1,78 @@
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# Add the project root to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from fine_gear_profile_generator.utils import config_manager
+
+class TestConfigManager(unittest.TestCase):
+
+    def setUp(self):
+        """Create a temporary working directory and a typical parameter set."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.params = {'module_m': '1.0', 'teeth_number_z': '18', 'offset_factor_x': '0.2'}
+
+    def tearDown(self):
+        """Remove the temporary directory and its contents after the test."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_saved_params_load_back_unchanged(self):
+        """Parameters written by save_params must be returned as-is by load_params."""
+        success, _ = config_manager.save_params(self.temp_dir, self.params)
+        self.assertTrue(success)
+        self.assertEqual(config_manager.load_params(self.temp_dir), (True, self.params))
+        self.assertEqual(os.listdir(self.temp_dir), ['Inputs.dat'], "Temporary file was left behind.")
+
+    def test_save_creates_missing_working_directory(self):
+        """save_params must create a working directory that does not exist yet."""
+        working_dir = os.path.join(self.temp_dir, 'new', 'dir')
+        success, _ = config_manager.save_params(working_dir, self.params)
+        self.assertTrue(success)
+        self.assertEqual(config_manager.load_params(working_dir), (True, self.params))
+
+    def test_identical_save_is_skipped_until_file_changes(self):
+        """Saving identical content does not rewrite the file, but a deleted file is written again."""
+        filepath = os.path.join(self.temp_dir, 'Inputs.dat')
+        config_manager.save_params(self.temp_dir, self.params)
+        success, message = config_manager.save_params(self.temp_dir, self.params)
+        self.assertTrue(success)
+        self.assertIn("No changes", message)
+
+        os.remove(filepath)
+        success, message = config_manager.save_params(self.temp_dir, self.params)
+        self.assertTrue(success)
+        self.assertTrue(os.path.exists(filepath))
+
+        success, message = config_manager.save_params(self.temp_dir, dict(self.params, module_m='2.0'))
+        self.assertIn("saved", message)
+        self.assertEqual(config_manager.load_params(self.temp_dir)[1]['module_m'], '2.0')
+
+    def test_identical_save_rewrites_externally_changed_file(self):
+        """Saving the same params again must overwrite content written outside the app."""
+        config_manager.save_params(self.temp_dir, self.params)
+        with open(os.path.join(self.temp_dir, 'Inputs.dat'), 'w') as f:
+            f.write('{"module_m": "2.5"}')
+
+        success, message = config_manager.save_params(self.temp_dir, self.params)
+        self.assertTrue(success)
+        self.assertIn("saved", message)
+        self.assertEqual(config_manager.load_params(self.temp_dir), (True, self.params))
+
+    def test_load_reflects_external_changes(self):
+        """Cached loads must be read-only and pick up edits made outside the app."""
+        config_manager.save_params(self.temp_dir, self.params)
+        success, loaded = config_manager.load_params(self.temp_dir)
+        with self.assertRaises(TypeError):
+            loaded['module_m'] = 'modified'
+        self.assertEqual(config_manager.load_params(self.temp_dir), (True, self.params))
+
+        with open(os.path.join(self.temp_dir, 'Inputs.dat'), 'w') as f:
+            f.write('{"module_m": "2.5"}')
+        self.assertEqual(config_manager.load_params(self.temp_dir), (True, {'module_m': '2.5'}))
+
+if __name__ == '__main__':
+    unittest.main()
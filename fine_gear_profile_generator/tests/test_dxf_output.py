@@ -3,6 +3,8 @@ import os
 import shutil
 import sys
 
+import ezdxf
+
 # Add the project root to the Python path to allow for absolute imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
@@ -62,5 +64,20 @@ class TestDxfOutput(unittest.TestCase):
         # Check if the file is not empty
         self.assertTrue(os.path.getsize(expected_filepath) > 0, "DXF file is empty.")
 
+    def test_binary_dxf_contains_all_teeth(self):
+        """
+        Tests that a binary DXF can be read back and holds one closed polyline per tooth
+        of both gears, like the default ASCII output.
+        """
+        gear1_data = geometry_generator.generate_tooth_profile(**self.gear1_params)
+        gear2_data = geometry_generator.generate_tooth_profile(**self.gear2_params)
+
+        dxf_exporter.export_gear_pair_to_dxf(self.temp_dir, gear1_data, gear2_data, 27.0, 0.0, 0.0, binary=True)
+
+        doc = ezdxf.readfile(os.path.join(self.temp_dir, dxf_exporter.DXF_FILENAME))
+        polylines = doc.modelspace().query('LWPOLYLINE')
+        self.assertEqual(len(polylines), 18 + 36)
+        self.assertTrue(all(polyline.closed for polyline in polylines))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,57 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+# Add the project root to the Python path to allow for absolute imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from fine_gear_profile_generator.core import gear_math
+
+class TestGearMath(unittest.TestCase):
+
+    def test_operating_pressure_angle_without_profile_shift(self):
+        """With zero total profile shift the operating angle equals the standard angle."""
+        alpha_w = gear_math.calculate_operating_pressure_angle(18, 36, 0.0, 0.0, 20.0)
+        self.assertAlmostEqual(alpha_w, np.deg2rad(20.0), places=12)
+
+    def test_operating_pressure_angle_solves_involute_equation(self):
+        """The solved angle must satisfy inv(alpha_w) = inv(alpha) + 2(x1+x2)tan(alpha)/(z1+z2)."""
+        z1, z2, x1, x2, alpha_deg = 18, 36, 0.2, 0.1, 20.0
+        alpha_rad = np.deg2rad(alpha_deg)
+        expected = gear_math.inv(alpha_rad) + 2 * (x1 + x2) * np.tan(alpha_rad) / (z1 + z2)
+        alpha_w = gear_math.calculate_operating_pressure_angle(z1, z2, x1, x2, alpha_deg)
+        self.assertAlmostEqual(gear_math.inv(alpha_w), expected, places=12)
+        self.assertGreater(alpha_w, alpha_rad)
+
+    def test_contact_ratio_batch_matches_scalar(self):
+        """Every element of the batched contact ratio must match the scalar calculation."""
+        z1 = np.array([12, 18, 18, 25, 40])
+        z2 = np.array([30, 36, 36, 50, 80])
+        x1 = np.array([0.3, 0.2, 0.0, -0.1, 0.5])
+        x2 = np.array([0.0, 0.0, 0.4, 0.1, -0.2])
+        epsilon, center = gear_math.calculate_contact_ratio_batch(1.5, z1, z2, x1, x2, 20.0)
+        for i in range(len(z1)):
+            expected_epsilon, expected_center = gear_math.calculate_contact_ratio(1.5, z1[i], z2[i], x1[i], x2[i], 20.0)
+            self.assertAlmostEqual(epsilon[i], expected_epsilon, places=12)
+            self.assertAlmostEqual(center[i], expected_center, places=12)
+
+    def test_undercut_batch_matches_scalar(self):
+        """The batched undercut flag must agree with the scalar warning for each gear."""
+        teeth = np.array([8, 12, 17, 30, -40])
+        shift = np.array([0.0, 0.3, 0.0, -0.5, 0.0])
+        at_risk = gear_math.check_undercut_batch(teeth, 20.0, shift, 1.0)
+        for i in range(len(teeth)):
+            status = gear_math.check_undercut(teeth[i], 20.0, shift[i], 1.0)
+            self.assertEqual(bool(at_risk[i]), status.startswith("Warning"))
+
+    def test_internal_gear_batch_matches_scalar_normalization(self):
+        """The batch normalization must agree element-wise with the scalar version."""
+        gears = [(18, 0.2, 0.05, 1.0, 1.25, 0.2, 0.1), (-40, 0.1, 0.05, 1.0, 1.25, 0.25, 0.15)]
+        batch = gear_math.handle_internal_gear_parameters_batch(*zip(*gears))
+        for i, gear in enumerate(gears):
+            expected = gear_math.handle_internal_gear_parameters(*gear)
+            self.assertEqual(tuple(values[i] for values in batch), expected)
+
+if __name__ == '__main__':
+    unittest.main()
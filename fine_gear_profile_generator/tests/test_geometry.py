@@ -6,7 +6,7 @@ import os
 # Add the project root to the Python path to allow for absolute imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from fine_gear_profile_generator.core import geometry_generator
+from fine_gear_profile_generator.core import geometry_generator, transformations
 
 class TestGeometryGeneration(unittest.TestCase):
 
@@ -65,5 +65,65 @@ class TestGeometryGeneration(unittest.TestCase):
         self.assertTrue(np.all(np.isfinite(X_tooth)), "X coordinates contain NaN or Inf values.")
         self.assertTrue(np.all(np.isfinite(Y_tooth)), "Y coordinates contain NaN or Inf values.")
 
+    def test_float32_profile_matches_float64_profile(self):
+        """
+        Tests that requesting float32 coordinates keeps that dtype through every
+        curve segment and stays within single-precision tolerance of the default.
+        """
+        X64, Y64, _, _, _ = geometry_generator.generate_tooth_profile(**self.test_params)
+        X32, Y32, _, _, _ = geometry_generator.generate_tooth_profile(**self.test_params, dtype=np.float32)
+
+        self.assertEqual(X32.dtype, np.float32)
+        self.assertEqual(Y32.dtype, np.float32)
+        np.testing.assert_allclose(X32, X64, rtol=0, atol=1e-5)
+        np.testing.assert_allclose(Y32, Y64, rtol=0, atol=1e-5)
+
+        # The combined profile is always allocated with the requested dtype, so check
+        # the individual curve segments as well
+        segments = (
+            geometry_generator.involute_curve(1.0, 20, 10, 0.1, 0.5, 0.35, 0.02, dtype=np.float32),
+            geometry_generator.root_round_curve(1.0, 20, 0.0, 1.25, 0.38, 0.0, 0.3, 0.1, 10, dtype=np.float32),
+            geometry_generator._arc(10.0, 0.0, 0.5, 10, 1.0, 2.0, dtype=np.float32),
+        )
+        for XX, YY in segments:
+            self.assertEqual(XX.dtype, np.float32)
+            self.assertEqual(YY.dtype, np.float32)
+
+    def test_generate_gear_pair_matches_individual_profiles(self):
+        """
+        Tests that generate_gear_pair produces the same profiles as two separate
+        generate_tooth_profile calls using the gear 1 and gear 2 parameters.
+        """
+        pair_params = dict(self.test_params, z2=40, x2=0.1)
+        gear1, gear2 = geometry_generator.generate_gear_pair(pair_params)
+
+        expected1 = geometry_generator.generate_tooth_profile(**self.test_params)
+        expected2 = geometry_generator.generate_tooth_profile(**dict(self.test_params, Z=40, X=0.1))
+
+        for actual, expected in ((gear1, expected1), (gear2, expected2)):
+            np.testing.assert_allclose(actual[0], expected[0])
+            np.testing.assert_allclose(actual[1], expected[1])
+            self.assertEqual(actual[2:], expected[2:])
+
+    def test_rotate_pattern_matches_rotate_then_translate(self):
+        """The fused rotate_pattern must reproduce rotating and translating each tooth separately."""
+        X_tooth, Y_tooth, Z, P_ANGLE, _ = geometry_generator.generate_tooth_profile(**self.test_params)
+        X_all, Y_all = transformations.rotate_pattern(X_tooth, Y_tooth, P_ANGLE, Z, 3.0, -2.0)
+        self.assertEqual(X_all.shape, (Z, len(X_tooth)))
+        for i in range(Z):
+            X_expected, Y_expected = transformations.translate(
+                *transformations.rotate(X_tooth, Y_tooth, P_ANGLE * i), 3.0, -2.0)
+            np.testing.assert_allclose(X_all[i], X_expected)
+            np.testing.assert_allclose(Y_all[i], Y_expected)
+
+    def test_rotate_and_affine_accept_scalar_points(self):
+        """rotate and affine must work on a single scalar point as well as on arrays."""
+        X, Y = transformations.rotate(1.0, 0.0, np.pi / 2)
+        self.assertAlmostEqual(X, 0.0)
+        self.assertAlmostEqual(Y, 1.0)
+        X, Y = transformations.affine(1.0, 0.0, np.pi / 2, 3.0, -2.0)
+        self.assertAlmostEqual(X, 3.0)
+        self.assertAlmostEqual(Y, -1.0)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,20 +1,70 @@
-import json
 import os
+import types
+
+PARAMS_FILENAME = 'Inputs.dat'
+
+# (digest, mtime_ns, size) of the content last written to each parameter file, used to
+# skip identical saves while the file on disk is still the one written
+_LAST_SAVED_STATES = {}
+# Parsed content of each loaded parameter file as (mtime_ns, size, data), reused until the file changes
+_LOADED_PARAMS_CACHE = {}
 
 def save_params(working_dir, params_dict):
     """
     Saves a dictionary of parameters to Inputs.dat in the specified directory.
+    The file is written and synced to a temporary file first and then moved into
+    place, so a failed save or a crash never leaves a truncated Inputs.dat behind.
+    Saving the same content again is skipped as long as the file on disk is unchanged
+    since it was written.
 
     Args:
         working_dir (str): The directory where the file will be saved.
         params_dict (dict): A dictionary containing the parameters to save.
                             Keys are parameter names, values are the values.
     """
-    os.makedirs(working_dir, exist_ok=True)
-    filepath = os.path.join(working_dir, 'Inputs.dat')
+    # json and hashlib are only needed once parameters are saved or loaded
+    import hashlib
+    import json
+
+    filepath = os.path.join(working_dir, PARAMS_FILENAME)
     try:
-        with open(filepath, 'w') as f:
-            json.dump(params_dict, f, indent=4)
+        # Serialized once; the same bytes are hashed and written
+        serialized = json.dumps(params_dict, indent=4).encode('utf-8')
+        digest = hashlib.blake2b(serialized).digest()
+        last_state = _LAST_SAVED_STATES.get(filepath)
+        if last_state is not None and last_state[0] == digest:
+            try:
+                stat = os.stat(filepath)
+            except FileNotFoundError:
+                stat = None
+            if stat is not None and last_state[1:] == (stat.st_mtime_ns, stat.st_size):
+                return True, f"No changes to save in {filepath}"
+
+        temp_path = filepath + '.tmp'
+        try:
+            try:
+                f = open(temp_path, 'wb')
+            except FileNotFoundError:
+                # The working directory is usually there already; only create it when missing
+                os.makedirs(working_dir, exist_ok=True)
+                f = open(temp_path, 'wb')
+            with f:
+                f.write(serialized)
+                # Make sure the data is on disk before the rename, or a crash could
+                # leave an empty Inputs.dat in place of the old one
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, filepath)
+            stat = os.stat(filepath)
+            # The file may change within the timestamp resolution, so do not trust the load cache
+            _LOADED_PARAMS_CACHE.pop(filepath, None)
+        except Exception:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        _LAST_SAVED_STATES[filepath] = (digest, stat.st_mtime_ns, stat.st_size)
         return True, f"Parameters saved to {filepath}"
     except Exception as e:
         return False, f"Error saving parameters: {e}"
@@ -22,24 +72,39 @@ def save_params(working_dir, params_dict):
 def load_params(working_dir):
     """
     Loads parameters from Inputs.dat in the specified directory.
+    The parsed content is cached and only read again once the file's modification
+    time or size changes. It is returned as a read-only mapping shared between
+    calls; copy it with dict() before modifying it.
 
     Args:
         working_dir (str): The directory from which to load the file.
 
     Returns:
         A tuple (success, data_or_error_message).
-        If successful, (True, dict_of_parameters).
+        If successful, (True, read_only_mapping_of_parameters).
         If failed, (False, error_message_string).
     """
-    filepath = os.path.join(working_dir, 'Inputs.dat')
-    if not os.path.exists(filepath):
+    import json
+
+    filepath = os.path.join(working_dir, PARAMS_FILENAME)
+    try:
+        stat = os.stat(filepath)
+    except FileNotFoundError:
         return False, f"File not found: {filepath}"
 
+    cached = _LOADED_PARAMS_CACHE.get(filepath)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return True, cached[2]
+
     try:
         with open(filepath, 'r') as f:
-            loaded_data = json.load(f)
+            loaded_data = types.MappingProxyType(dict(json.load(f)))
+        _LOADED_PARAMS_CACHE[filepath] = (stat.st_mtime_ns, stat.st_size, loaded_data)
         return True, loaded_data
+    except FileNotFoundError:
+        # Removed after the stat above
+        return False, f"File not found: {filepath}"
     except json.JSONDecodeError:
         return False, f"Error: The file {filepath} is not a valid JSON file."
     except Exception as e:
-        return False, f"Failed to load parameters: {e}"
\ No newline at end of file
+        return False, f"Failed to load parameters: {e}"